@@ -3,20 +3,28 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import threading
+import time
 import traceback
+import gzip
+import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
 
-from requests import Response, Session, codes
+from requests import PreparedRequest, Request, Response, Session, codes
 from requests.structures import CaseInsensitiveDict
 from requests.adapters import HTTPAdapter, Retry
 from requests import RequestException
 
 from carconnectivity.errors import ConfigurationError
+from carconnectivity.observable import Observable
 from carconnectivity.util import config_remove_credentials
 from carconnectivity.vehicle import GenericVehicle, ElectricVehicle
 from carconnectivity.charging import Charging
 from carconnectivity.drive import GenericDrive
+from carconnectivity.position import Position
 from carconnectivity.attributes import DurationAttribute, EnumAttribute
 from carconnectivity.enums import ConnectionState
 from carconnectivity.units import Temperature, Length, Power
@@ -25,7 +33,7 @@ from carconnectivity_plugins.abrp._version import __version__
 from carconnectivity_plugins.abrp.abrp_object import ABRP
 
 if TYPE_CHECKING:
-    from typing import Dict, Optional, Any, Tuple
+    from typing import Deque, Dict, List, Optional, Any, Tuple
     from carconnectivity.carconnectivity import CarConnectivity
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.abrp")
@@ -33,12 +41,33 @@ LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.abrp")
 
 API_BASE_URL = 'https://api.iternio.com/1/'
 CARCONNECTIVITY_IDENTIFIER = '6225724a-65fb-4d4c-9ac5-d7dff2b78c1d'
+TLM_SEND_URL = API_BASE_URL + 'tlm/send'
+TLM_GET_NEXT_CHARGE_URL = API_BASE_URL + 'tlm/get_next_charge'
+REQUEST_TIMEOUT = (3.05, 10)
+MAX_STALE_SECONDS = 900
 
 HEADER = CaseInsensitiveDict({'accept': 'application/json',
                               'user-agent': f'CarConnectivity ({__version__})',
                               'accept-language': 'en-en',
                               'Authorization': f'APIKEY {CARCONNECTIVITY_IDENTIFIER}'})
 
+_IS_CHARGING_MAP = {Charging.ChargingState.CHARGING: True,
+                    Charging.ChargingState.CONSERVATION: True,
+                    Charging.ChargingState.DISCHARGING: True,
+                    Charging.ChargingState.OFF: False,
+                    Charging.ChargingState.READY_FOR_CHARGING: False,
+                    Charging.ChargingState.ERROR: False}
+
+_IS_DCFC_MAP = {Charging.ChargingType.DC: True,
+                Charging.ChargingType.AC: False}
+
+_IS_PARKED_MAP = {Position.PositionType.PARKING: True,
+                  Position.PositionType.DRIVING: False}
+
+# (vehicle attribute, telemetry key, conversion method, target unit) for plain scalar fields
+_VEHICLE_FIELDS = (('odometer', 'odometer', 'range_in', Length.KM),
+                   ('outside_temperature', 'ext_temp', 'temperature_in', Temperature.C))
+
 
 class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
     """
@@ -53,15 +82,24 @@ class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
 
         self._background_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._update_event = threading.Event()
+        self._error_lock = threading.Lock()
+
+        self._last_sent: Dict[str, float] = {}
+        self._last_attempt: Dict[str, float] = {}
+        self._last_sent_telemetry: Dict[str, Dict] = {}
+        self._electric_drive_cache: Dict[str, GenericDrive] = {}
+        self._utc_cache: Dict[str, Tuple[datetime, float]] = {}
+        self._outbox: Deque[Tuple[str, GenericVehicle, str, Dict[str, Any], Dict[str, Any]]] = deque(maxlen=1024)
 
         self.subsequent_errors: int = 0
         self.__session: Session = Session()
-        self.__session.headers = HEADER  # pyright: ignore[reportAttributeAccessIssue]
-        retries = Retry(total=3, connect=3, read=3, status=3, other=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-        self.__session.mount('https://api.iternio.com', HTTPAdapter(max_retries=retries))
+        self.__session.headers.update(HEADER)
 
         self.last_telemetry_data: Dict[str, Tuple[datetime, Dict]] = {}
         self.abrp_objects: Dict[str, ABRP] = {}
+        self._next_charge_etag: Dict[str, str] = {}
+        self._next_charge_content: Dict[str, bytes] = {}
 
         self.connection_state: EnumAttribute[ConnectionState] = EnumAttribute(name="connection_state", parent=self, value_type=ConnectionState,
                                                                               value=ConnectionState.DISCONNECTED, tags={'plugin_custom'})
@@ -75,6 +113,17 @@ class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
             raise ConfigurationError('No ABRP Tokens specified in config ("tokens" missing)')
         self.active_config['tokens'] = config['tokens']
 
+        self._publish_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=min(8, len(self.active_config['tokens'])),
+                                                                    thread_name_prefix='carconnectivity.plugins.abrp-publish')
+
+        retries = Retry(total=3, connect=3, read=3, status=3, other=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+        self.__session.mount('https://api.iternio.com', HTTPAdapter(pool_connections=1, pool_maxsize=max(16, len(self.active_config['tokens']) * 2),
+                                                                    pool_block=False, max_retries=retries))
+        self.__tlm_send_template: PreparedRequest = self.__session.prepare_request(
+            Request('POST', TLM_SEND_URL, headers={'Content-Type': 'application/json'}))
+        self.__tlm_send_urls: Dict[str, str] = {token: TLM_SEND_URL + '?token=' + quote(token, safe='')
+                                                for token in self.active_config['tokens'].values()}
+
         self.active_config['interval'] = 60
         if 'interval' in config:
             self.active_config['interval'] = config['interval']
@@ -92,130 +141,306 @@ class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
 
     def startup(self) -> None:
         LOG.info("Starting ABRP plugin")
+        self.car_connectivity.garage.add_observer(self.__on_vehicle_update, flag=Observable.ObserverEvent.UPDATED, on_transaction_end=True)
         self._background_thread = threading.Thread(target=self._background_loop, daemon=False)
         self._background_thread.name = 'carconnectivity.plugins.abrp-background'
         self._background_thread.start()
         self.healthy._set_value(value=True)  # pylint: disable=protected-access
         LOG.debug("Starting ABRP plugin done")
 
+    def __on_vehicle_update(self, element: Any, flags: Observable.ObserverEvent) -> None:
+        """
+        Observer callback waking the background thread when vehicle data was updated.
+
+        Runs on the notifying thread and must stay cheap: all telemetry building and
+        network I/O happens on the background thread and its publish pool.
+        """
+        del element, flags
+        if not self._stop_event.is_set():
+            self._update_event.set()
+
+    def __on_drives_changed(self, element: Any, flags: Observable.ObserverEvent) -> None:
+        """
+        Observer callback invalidating cached drive references when drives are enabled or disabled.
+        """
+        del element, flags
+        self._electric_drive_cache.clear()
+
     def _background_loop(self) -> None:
         self._stop_event.clear()
-        while not self._stop_event.is_set():
+        stop_event = self._stop_event
+        update_event = self._update_event
+        interval_attribute = self.interval
+        outbox = self._outbox
+        while not stop_event.is_set():
             try:
-                for vin, token in self.active_config['tokens'].items():
-                    if self.connection_state.value != ConnectionState.CONNECTED:
-                        self.connection_state._set_value(value=ConnectionState.CONNECTING)  # pylint: disable=protected-access
-                    self._update_and_publish_telemetry(vin, token)
-                if self.interval.value is not None:
-                    self._stop_event.wait(self.interval.value.total_seconds())
-                else:
-                    self._stop_event.wait(60)
-            except Exception as err:
+                interval_value = interval_attribute.value
+                interval_s: float = interval_value.total_seconds() if interval_value is not None else 60
+                now: float = time.monotonic()
+                self._queue_due_telemetry(now, interval_s)
+                if outbox and self.connection_state.value != ConnectionState.CONNECTED:
+                    self.connection_state._set_value(value=ConnectionState.CONNECTING)  # pylint: disable=protected-access
+                entries = self._drain_due_entries(now)
+                if entries:
+                    self._publish_telemetry_batch(entries, now)
+                remaining: float = now + interval_s - time.monotonic()
+                if entries and remaining < 0.0:
+                    LOG.warning('ABRP publish cycle took %.1fs, longer than the configured interval of %.0fs', interval_s - remaining, interval_s)
+                update_event.wait(max(0.0, remaining))
+                update_event.clear()
+                if self.healthy.value is False:
+                    self.healthy._set_value(value=True)  # pylint: disable=protected-access
+            except MemoryError:
+                raise
+            except Exception:  # pylint: disable=broad-exception-caught
                 LOG.critical('Critical error during update: %s', traceback.format_exc())
                 self.healthy._set_value(value=False)  # pylint: disable=protected-access
                 self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                raise err
+                with self._error_lock:
+                    self.subsequent_errors += 1
+                    subsequent_errors = self.subsequent_errors
+                stop_event.wait(min(2 ** subsequent_errors, 300))
+
+    def _queue_due_telemetry(self, now: float, interval_s: float) -> None:
+        """
+        Builds delta payloads for all configured vehicles that are due for publishing
+        and appends them to the outbox.
+
+        Vehicles that already have an entry queued or published less than interval_s
+        seconds ago are skipped. A payload whose only change is the utc timestamp is
+        skipped as well unless the last publish is older than MAX_STALE_SECONDS, in
+        which case a full refresh is queued.
+
+        Args:
+            now (float): The monotonic timestamp of the current publish cycle.
+            interval_s (float): The configured minimum spacing between publishes in seconds.
+        """
+        garage = self.car_connectivity.garage
+        tokens: Dict[str, str] = self.active_config['tokens']
+        last_sent = self._last_sent
+        outbox = self._outbox
+        queued_vins = {entry[0] for entry in outbox}
+        for vin, token in tokens.items():
+            if vin in queued_vins or now - last_sent.get(vin, 0.0) < interval_s:
+                continue
+            vehicle: Optional[GenericVehicle] = garage.get_vehicle(vin)
+            if vehicle is None:
+                continue
+            telemetry_data: Optional[Dict[str, Any]] = self._build_telemetry(vin, vehicle)
+            if telemetry_data is None:
+                continue
+            last_payload: Dict[str, Any] = self._last_sent_telemetry.get(vin, {})
+            delta: Dict[str, Any] = {key: value for key, value in telemetry_data.items() if last_payload.get(key) != value}
+            if not delta.keys() - {'utc'}:
+                if now - last_sent.get(vin, 0.0) < MAX_STALE_SECONDS:
+                    continue
+                delta = dict(telemetry_data)
+            for key in ('utc', 'soc'):
+                if key in telemetry_data:
+                    delta[key] = telemetry_data[key]
+            outbox.append((vin, vehicle, token, telemetry_data, delta))
+
+    def _drain_due_entries(self, now: float) -> List[Tuple[str, GenericVehicle, str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Removes and returns the outbox entries that are due for a publish attempt.
+
+        Fresh entries are always due. Entries that already failed an attempt stay queued
+        until an exponential backoff (doubling per subsequent error, capped at 300 seconds)
+        has elapsed, so a busy vehicle waking the loop with frequent updates cannot hammer
+        an unreachable API.
+
+        Args:
+            now (float): The monotonic timestamp of the current publish cycle.
+        """
+        outbox = self._outbox
+        last_attempt = self._last_attempt
+        retry_wait: float = min(2.0 ** self.subsequent_errors, 300.0)
+        entries = []
+        deferred = []
+        while outbox:
+            entry = outbox.popleft()
+            if now - last_attempt.get(entry[0], 0.0) < retry_wait:
+                deferred.append(entry)
+            else:
+                entries.append(entry)
+        outbox.extend(deferred)
+        return entries
 
     def shutdown(self) -> None:
         self._stop_event.set()
+        self._update_event.set()
+        self.car_connectivity.garage.remove_observer(self.__on_vehicle_update)
         if self._background_thread is not None:
             self._background_thread.join()
+        self._publish_pool.shutdown(wait=True)
         self.connection_state._set_value(value=ConnectionState.DISCONNECTED)  # pylint: disable=protected-access
         return super().shutdown()
 
-    def _update_and_publish_telemetry(self, vin: str, token: str) -> None:  # pylint: disable=too-many-branches, too-many-statements
+    def _build_telemetry(self, vin: str, vehicle: GenericVehicle) \
+            -> Optional[Dict[str, Any]]:  # pylint: disable=too-many-branches, too-many-statements, too-many-locals
         """
-        Publishes the data of the given vehicle to ABRP.
+        Builds the telemetry data of the given vehicle for publishing to ABRP.
         Args:
-            vehicle (GenericVehicle): The vehicle to publish data for.
+            vin (str): The VIN the vehicle is configured under.
+            vehicle (GenericVehicle): The vehicle to build telemetry data for.
+
+        Returns:
+            Optional[Dict[str, Any]]: The telemetry data or None if the vehicle cannot be published at the moment.
         """
-        vehicle: Optional[GenericVehicle] = self.car_connectivity.garage.get_vehicle(vin)
-        if vehicle is None:
-            return
         for connector in vehicle.managing_connectors:
             if not connector.is_healthy():
                 LOG.error("not updating telemetry for vehicle %s due to unhealthy connector %s", vehicle.vin, connector.id)
-                return
+                return None
         LOG.debug("updating telemetry for vehicle %s", vehicle.vin)
         telemetry_data: Dict[str, Any] = {}
         if vehicle.drives.enabled:
-            electric_drive: Optional[GenericDrive] = None
-            if len(vehicle.drives.drives) == 1 and next(iter(vehicle.drives.drives.values())).enabled:
-                electric_drive = next(iter(vehicle.drives.drives.values()))
-            elif len(vehicle.drives.drives) > 1:
-                for drive in vehicle.drives.drives.values():
-                    if drive.enabled and drive.type.value == GenericDrive.Type.ELECTRIC:
-                        electric_drive = drive
-                        break
+            electric_drive: Optional[GenericDrive] = self._electric_drive_cache.get(vin)
+            if electric_drive is None:
+                drives = vehicle.drives.drives
+                if len(drives) == 1:
+                    only_drive = next(iter(drives.values()))
+                    if only_drive.enabled:
+                        electric_drive = only_drive
+                else:
+                    electric_drive = next((drive for drive in drives.values()
+                                           if drive.enabled and drive.type.value == GenericDrive.Type.ELECTRIC), None)
+                if electric_drive is not None:
+                    self._electric_drive_cache[vin] = electric_drive
+                    vehicle.drives.add_observer(self.__on_drives_changed,
+                                                flag=Observable.ObserverEvent.ENABLED | Observable.ObserverEvent.DISABLED)
             if electric_drive is not None:
-                if electric_drive.level.enabled and electric_drive.level.value is not None:
-                    telemetry_data['soc'] = electric_drive.level.value
-                    if electric_drive.level.last_updated is not None:
-                        telemetry_data['utc'] = electric_drive.level.last_updated.astimezone(timezone.utc).timestamp()
+                level = electric_drive.level
+                level_value = level.value if level.enabled else None
+                if level_value is not None:
+                    telemetry_data['soc'] = level_value
+                    last_updated = level.last_updated
+                    if last_updated is not None:
+                        cached_utc = self._utc_cache.get(vin)
+                        if cached_utc is not None and cached_utc[0] is last_updated:
+                            telemetry_data['utc'] = cached_utc[1]
+                        else:
+                            utc_timestamp = last_updated.timestamp()
+                            self._utc_cache[vin] = (last_updated, utc_timestamp)
+                            telemetry_data['utc'] = utc_timestamp
 
-                if electric_drive.range.enabled and electric_drive.range.value is not None:
-                    telemetry_data['est_battery_range'] = electric_drive.range.value
+                drive_range = electric_drive.range
+                range_value = drive_range.value if drive_range.enabled else None
+                if range_value is not None:
+                    telemetry_data['est_battery_range'] = range_value
 
-        if vehicle.odometer.enabled and vehicle.odometer.value is not None:
-            telemetry_data['odometer'] = vehicle.odometer.range_in(Length.KM)
+        for attribute_name, telemetry_key, conversion, unit in _VEHICLE_FIELDS:
+            attribute = getattr(vehicle, attribute_name)
+            if attribute.enabled and attribute.value is not None:
+                telemetry_data[telemetry_key] = getattr(attribute, conversion)(unit)
 
         if isinstance(vehicle, ElectricVehicle):
-            if vehicle.charging is not None and vehicle.charging.enabled:
-                if vehicle.charging.state.enabled and vehicle.charging.state.value is not None:
-                    if vehicle.charging.state.value in [Charging.ChargingState.CHARGING,
-                                                        Charging.ChargingState.CONSERVATION,
-                                                        Charging.ChargingState.DISCHARGING]:
-                        telemetry_data['is_charging'] = True
-                    elif vehicle.charging.state.value in [Charging.ChargingState.OFF,
-                                                          Charging.ChargingState.READY_FOR_CHARGING,
-                                                          Charging.ChargingState.ERROR]:
-                        telemetry_data['is_charging'] = False
-                if vehicle.charging.type.enabled and vehicle.charging.type.value is not None:
-                    if vehicle.charging.type.value == Charging.ChargingType.DC:
-                        telemetry_data['is_dcfc'] = True
-                    elif vehicle.charging.type.value == Charging.ChargingType.AC:
-                        telemetry_data['is_dcfc'] = False
-                if vehicle.charging.power.enabled and vehicle.charging.power.value is not None:
-                    power: float = vehicle.charging.power.power_in(Power.KW) * -1  # type: ignore[reportOptionalOperand]
-                    if vehicle.charging.state.enabled and vehicle.charging.state.value is not None \
-                            and vehicle.charging.state.value == Charging.ChargingState.DISCHARGING:
+            charging = vehicle.charging
+            if charging is not None and charging.enabled:
+                state = charging.state
+                state_value = state.value if state.enabled else None
+                if state_value is not None:
+                    is_charging = _IS_CHARGING_MAP.get(state_value)
+                    if is_charging is not None:
+                        telemetry_data['is_charging'] = is_charging
+                charging_type = charging.type
+                charging_type_value = charging_type.value if charging_type.enabled else None
+                if charging_type_value is not None:
+                    is_dcfc = _IS_DCFC_MAP.get(charging_type_value)
+                    if is_dcfc is not None:
+                        telemetry_data['is_dcfc'] = is_dcfc
+                power_attribute = charging.power
+                if power_attribute.enabled and power_attribute.value is not None:
+                    power: float = power_attribute.power_in(Power.KW) * -1  # type: ignore[reportOptionalOperand]
+                    if state_value == Charging.ChargingState.DISCHARGING:
                         power = power * -1
                     telemetry_data['power'] = power
 
-        if not self.active_config['hide_location'] and vehicle.position is not None and vehicle.position.enabled:
-            if vehicle.position.position_type.enabled and vehicle.position.position_type.value is not None:
-                if vehicle.position.position_type.value == vehicle.position.PositionType.PARKING:
-                    telemetry_data['is_parked'] = True
-                elif vehicle.position.position_type.value == vehicle.position.PositionType.DRIVING:
-                    telemetry_data['is_parked'] = False
-            if 'overwrite_location' in self.active_config and self.active_config['overwrite_location'] is not None:
-                if 'lat' in self.active_config['overwrite_location'] and self.active_config['overwrite_location']['lat'] is not None \
-                        and isinstance(self.active_config['overwrite_location']['lat'], (float, int)):
-                    telemetry_data['lat'] = self.active_config['overwrite_location']['lat']
-                if 'lon' in self.active_config['overwrite_location'] and self.active_config['overwrite_location']['lon'] is not None \
-                        and isinstance(self.active_config['overwrite_location']['lon'], (float, int)):
-                    telemetry_data['lon'] = self.active_config['overwrite_location']['lon']
-                if 'elevation' in self.active_config['overwrite_location'] and self.active_config['overwrite_location']['elevation'] is not None \
-                        and isinstance(self.active_config['overwrite_location']['elevation'], (float, int)):
-                    telemetry_data['elevation'] = self.active_config['overwrite_location']['elevation']
+        position = vehicle.position
+        if not self.active_config['hide_location'] and position is not None and position.enabled:
+            position_type = position.position_type
+            position_type_value = position_type.value if position_type.enabled else None
+            if position_type_value is not None:
+                is_parked = _IS_PARKED_MAP.get(position_type_value)
+                if is_parked is not None:
+                    telemetry_data['is_parked'] = is_parked
+            overwrite_location = self.active_config.get('overwrite_location')
+            if overwrite_location is not None:
+                for location_key in ('lat', 'lon', 'elevation'):
+                    location_value = overwrite_location.get(location_key)
+                    if location_value is not None and isinstance(location_value, (float, int)):
+                        telemetry_data[location_key] = location_value
             else:
-                if vehicle.position.latitude.enabled and vehicle.position.latitude.value is not None \
-                        and vehicle.position.longitude.enabled and vehicle.position.longitude.value is not None:
-                    telemetry_data['lat'] = vehicle.position.latitude.value
-                    telemetry_data['lon'] = vehicle.position.longitude.value
-                if vehicle.position.altitude.enabled and vehicle.position.altitude.value is not None:
-                    telemetry_data['elevation'] = vehicle.position.altitude.range_in(Length.M)
-                if vehicle.position.heading.enabled and vehicle.position.heading.value is not None:
-                    telemetry_data['heading'] = vehicle.position.heading.value
-        if vehicle.outside_temperature.enabled and vehicle.outside_temperature.value is not None:
-            telemetry_data['ext_temp'] = vehicle.outside_temperature.temperature_in(Temperature.C)
-        if vehicle.climatization.enabled and vehicle.climatization.settings.enabled and vehicle.climatization.settings.target_temperature is not None \
-                and vehicle.climatization.settings.target_temperature.enabled and vehicle.climatization.settings.target_temperature.value is not None:
-            telemetry_data['hvac_setpoint'] = vehicle.climatization.settings.target_temperature.temperature_in(Temperature.C)
-        self._publish_telemetry(vin, telemetry_data, token)
-        self._get_next_charge(vehicle=vehicle, token=token)
-
-    def _get_next_charge(self, vehicle: GenericVehicle, token: str) -> None:
+                latitude = position.latitude
+                longitude = position.longitude
+                if latitude.enabled and latitude.value is not None and longitude.enabled and longitude.value is not None:
+                    telemetry_data['lat'] = latitude.value
+                    telemetry_data['lon'] = longitude.value
+                altitude = position.altitude
+                if altitude.enabled and altitude.value is not None:
+                    telemetry_data['elevation'] = altitude.range_in(Length.M)
+                heading = position.heading
+                if heading.enabled and heading.value is not None:
+                    telemetry_data['heading'] = heading.value
+        climatization = vehicle.climatization
+        if climatization.enabled and climatization.settings.enabled:
+            target_temperature = climatization.settings.target_temperature
+            if target_temperature is not None and target_temperature.enabled and target_temperature.value is not None:
+                telemetry_data['hvac_setpoint'] = target_temperature.temperature_in(Temperature.C)
+        return telemetry_data
+
+    def _publish_telemetry_batch(self, entries: List[Tuple[str, GenericVehicle, str, Dict[str, Any], Dict[str, Any]]], now: float) -> None:
+        """
+        Publishes a batch of outbox entries concurrently over the shared session.
+
+        Accepted entries advance the per-VIN bookkeeping; undelivered entries are put back
+        at the front of the outbox in their original order for the next attempt. Entries
+        that reached the server but were rejected only advance the send timestamp so the
+        unaccepted fields are included in the next regular publish again.
+
+        Args:
+            entries (List[Tuple]): The outbox entries to publish.
+            now (float): The monotonic timestamp of the current publish cycle.
+        """
+        failed = []
+        for entry, result in zip(entries, self._publish_pool.map(self.__publish_entry, entries)):
+            if result:
+                self._last_sent[entry[0]] = now
+                self._last_sent_telemetry[entry[0]] = entry[3]
+                self._last_attempt.pop(entry[0], None)
+            elif result is None:
+                self._last_sent[entry[0]] = now
+                self._last_attempt.pop(entry[0], None)
+            else:
+                self._last_attempt[entry[0]] = now
+                failed.append(entry)
+        self._outbox.extendleft(reversed(failed))
+
+    def __publish_entry(self, entry: Tuple[str, GenericVehicle, str, Dict[str, Any], Dict[str, Any]]) -> Optional[bool]:
+        """
+        Publishes a single outbox entry and fetches the next charge for its vehicle.
+
+        Returns:
+            Optional[bool]: The publish result, see _publish_telemetry.
+        """
+        vin, vehicle, token, telemetry_data, delta = entry
+        result: Optional[bool] = self._publish_telemetry(vin, telemetry_data, token, delta)
+        if result:
+            self._get_next_charge(vehicle=vehicle, token=token)
+        return result
+
+    def __log_failure(self, message: str, *args: Any) -> None:
+        """
+        Logs a failed ABRP request and tracks the error state.
+
+        The first failure in a row is logged as a warning, subsequent ones as errors.
+        """
+        with self._error_lock:
+            self.subsequent_errors += 1
+            subsequent_errors = self.subsequent_errors
+        LOG.log(logging.ERROR if subsequent_errors > 1 else logging.WARNING, message, *args)
+        self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
+
+    def _get_next_charge(self, vehicle: GenericVehicle, token: str) -> None:  # pylint: disable=too-many-branches
         if token not in self.abrp_objects:
             abrp_object: ABRP = ABRP(vehicle=vehicle)
             self.abrp_objects[token] = abrp_object
@@ -223,9 +448,21 @@ class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
             abrp_object = self.abrp_objects[token]
 
         params: Dict[str, str] = {'token': token}
+        headers: Optional[Dict[str, str]] = None
+        etag: Optional[str] = self._next_charge_etag.get(token)
+        if etag is not None:
+            headers = {'If-None-Match': etag}
         try:
-            response: Response = self.__session.post(API_BASE_URL + 'tlm/get_next_charge', params=params)
+            response: Response = self.__session.post(TLM_GET_NEXT_CHARGE_URL, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == codes['not_modified']:
+                return
             if response.status_code == codes['ok']:
+                new_etag: Optional[str] = response.headers.get('ETag')
+                if new_etag is not None:
+                    self._next_charge_etag[token] = new_etag
+                if response.content == self._next_charge_content.get(token):
+                    return
+                self._next_charge_content[token] = response.content
                 response_json = response.json()
                 if 'status' in response_json and response_json['status'] == 'ok':
                     if 'next_charge' in response_json and response_json['next_charge'] is not None:
@@ -237,47 +474,51 @@ class Plugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
             else:
                 abrp_object.next_charge_level._set_value(None)  # pylint: disable=protected-access
         except RequestException as e:
-            if self.subsequent_errors > 0:
-                LOG.error('ABRP get next charge for vehicle %s failed: %s, will try again after next publish', vehicle.vin, e)
-            else:
-                LOG.warning('ABRP get next charge for vehicle %s failed: %s, will try again after next publish', vehicle.vin, e)
-            self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
+            self.__log_failure('ABRP get next charge for vehicle %s failed: %s, will try again after next publish', vehicle.vin, e)
 
-    def _publish_telemetry(self, vin: str, telemetry_data: Dict, token: str):  # noqa: C901  # pylint: disable=too-many-branches
-        params: Dict[str, str] = {'token': token}
-        data: Dict[str, Dict[str, Any]] = {'tlm': telemetry_data}
-        try:  # pylint: disable=too-many-nested-blocks
-            response: Response = self.__session.post(API_BASE_URL + 'tlm/send', params=params, json=data)
+    def _publish_telemetry(self, vin: str, telemetry_data: Dict, token: str, delta: Dict) -> Optional[bool]:
+        """
+        Publishes the telemetry delta of the given vehicle to ABRP.
+
+        Returns:
+            Optional[bool]: True if ABRP accepted the data, None if the request was delivered but
+                rejected (retrying the same payload is pointless), False if the request could not
+                be delivered and should be retried.
+        """
+        data: Dict[str, Dict[str, Any]] = {'tlm': delta}
+        request: PreparedRequest = self.__tlm_send_template.copy()
+        request.url = self.__tlm_send_urls.get(token, TLM_SEND_URL + '?token=' + quote(token, safe=''))
+        body: bytes = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        if len(body) > 512:
+            body = gzip.compress(body, compresslevel=1)
+            request.headers['Content-Encoding'] = 'gzip'
+        request.prepare_body(data=body, files=None)
+        LOG.debug('publishing telemetry %s for vehicle %s', data, vin)
+        try:
+            settings: Dict[str, Any] = self.__session.merge_environment_settings(request.url, {}, None, None, None)
+            response: Response = self.__session.send(request, timeout=REQUEST_TIMEOUT, **settings)
             if response.status_code != codes['ok']:
-                LOG.error('ABRP send telemetry %s for vehicle vin failed with status code %d', str(data), response.status_code)
+                self.__log_failure('ABRP send telemetry for vehicle %s failed with status code %d', vin, response.status_code)
+                return None
+            response_data = response.json()
+            if response_data is None or 'status' not in response_data:
+                self.__log_failure('ABRP send telemetry for vehicle %s returned unexpected data %s', vin, response_data)
+                return None
+            accepted: Optional[bool] = True
+            if response_data['status'] != 'ok':
+                self.__log_failure('ABRP send telemetry for vehicle %s failed', vin)
+                accepted = None
             else:
-                response_data = response.json()
-                if response_data is not None:
-                    if 'status' in response_data:
-                        if response_data['status'] != 'ok':
-                            if self.subsequent_errors > 0:
-                                LOG.error('ABRP send telemetry %s for vehicle %s failed', str(data), vin)
-                            else:
-                                LOG.warning('ABRP send telemetry %s for vehicle %s failed', str(data), vin)
-                            self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                        else:
-                            self.subsequent_errors = 0
-                            self.connection_state._set_value(value=ConnectionState.CONNECTED)  # pylint: disable=protected-access
-                            self.last_telemetry_data[vin] = (datetime.now(tz=timezone.utc), telemetry_data)
-                        if 'missing' in response_data:
-                            LOG.info('ABRP send telemetry %s for vehicle %s: %s', str(data), vin, response_data["missing"])
-                    else:
-                        LOG.error('ABRP send telemetry %s for vehicle %s returned unexpected data %s', str(data), vin, str(response_data))
-                        self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                else:
-                    LOG.error('ABRP send telemetry %s for vehicle %s for account returned empty data', str(data), vin)
-                    self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
+                with self._error_lock:
+                    self.subsequent_errors = 0
+                self.connection_state._set_value(value=ConnectionState.CONNECTED)  # pylint: disable=protected-access
+                self.last_telemetry_data[vin] = (datetime.now(tz=timezone.utc), telemetry_data)
+            if 'missing' in response_data:
+                LOG.info('ABRP send telemetry for vehicle %s: %s', vin, response_data["missing"])
+            return accepted
         except RequestException as e:
-            if self.subsequent_errors > 0:
-                LOG.error('ABRP send telemetry %s for vehicle %s failed: %s, will try again after next change', str(data), vin, e)
-            else:
-                LOG.warning('ABRP send telemetry %s for vehicle %s failed: %s, will try again after next change', str(data), vin, e)
-            self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
+            self.__log_failure('ABRP send telemetry for vehicle %s failed: %s, will try again after next change', vin, e)
+            return False
 
     def get_version(self) -> str:
         return __version__
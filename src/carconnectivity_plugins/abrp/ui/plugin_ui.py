@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import functools
 import os
 
 import flask
@@ -13,6 +14,8 @@ from carconnectivity_plugins.base.ui.plugin_ui import BasePluginUI
 if TYPE_CHECKING:
     from typing import Optional, List, Dict, Union, Literal
 
+_TEMPLATE_DIR: str = os.path.join(os.path.dirname(__file__), 'templates')
+
 
 class PluginUI(BasePluginUI):
     """
@@ -20,23 +23,30 @@ class PluginUI(BasePluginUI):
     """
     def __init__(self, plugin: BasePlugin, app: flask.Flask, *args, **kwargs):
         blueprint: Optional[flask.Blueprint] = flask.Blueprint(name=plugin.id, import_name='carconnectivity-plugin-abrp', url_prefix=f'/{plugin.id}',
-                                                               template_folder=os.path.dirname(__file__) + '/templates')
+                                                               template_folder=_TEMPLATE_DIR)
         super().__init__(plugin, blueprint=blueprint, app=app, *args, **kwargs)
 
         @self.blueprint.route('/', methods=['GET'])
         def root():
-            return flask.redirect(flask.url_for('plugins.abrp.status'))
+            return flask.redirect(self._status_url)
 
         @self.blueprint.route('/status', methods=['GET'])
         @flask_login.login_required
         def status():
             return flask.render_template('abrp/status.html', current_app=flask.current_app, plugin=self.plugin)
 
+    @functools.cached_property
+    def _status_url(self) -> str:
+        """
+        The URL of the status page, resolved once on first use instead of per request.
+        """
+        return flask.url_for('plugins.abrp.status')
+
     def get_nav_items(self) -> List[Dict[Literal['text', 'url', 'sublinks', 'divider'], Union[str, List]]]:
         """
         Generates a list of navigation items for the ABRP plugin UI.
         """
-        return super().get_nav_items() + [{"text": "Status", "url": flask.url_for('plugins.abrp.status')}]
+        return super().get_nav_items() + [{"text": "Status", "url": self._status_url}]
 
     def get_title(self) -> str:
         """